@@ -12,17 +12,22 @@ the resulting array has shape $N\times D$.
 Functions:
     create_dolfin_function: Compile a dolfin function from string expressions.
     convert_to_numpy: Convert a dolfin vector to a numpy array.
+    convert_many_to_numpy: Convert multiple dolfin vectors on a function space to numpy arrays.
     convert_to_dolfin: Convert a numpy array to a dolfin function.
     convert_multivector_to_numpy: Convert a Hippylib multivector to a list of numpy arrays.
     convert_to_multivector: Convert a list of numpy arrays to a Hippylib multivector.
     get_coordinates: Get the coordinates of the mesh underlying a function space.
+    get_component_dofs: Get the cached dof index table of a (vector) function space.
+    get_array_shape: Get the shape of numpy arrays representing vectors on a function space.
     extract_components: Extract components of a vector defined on a vector function space.
     combine_components: Combine a list of component vectors into a vector
         on a vector function space.
     convert_matrix_to_scipy: Convert a dolfin matrix to a Scipy sparse array.
 """
 
-from collections.abc import Iterable
+import re
+import weakref
+from collections.abc import Iterable, Sequence
 
 import dolfin as dl
 import hippylib as hl
@@ -30,6 +35,16 @@ import numpy as np
 import numpy.typing as npt
 import scipy as sp
 
+# Caches of component dof index tables and dof coordinates, keyed by function space id. Entries are
+# removed once the function space is garbage collected, see `_add_to_cache`.
+_dof_indices_cache: dict[int, tuple[npt.NDArray[np.integer], str]] = {}
+_coordinates_cache: dict[int, npt.NDArray[np.floating]] = {}
+
+# Expressions that can be evaluated at the dof coordinates directly, without JIT compilation
+_CONSTANT_EXPRESSION = re.compile(r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$")
+_COORDINATE_EXPRESSION = re.compile(r"^\s*x\[(\d)\]\s*$")
+_NODAL_ELEMENT_FAMILIES = ("Lagrange", "Discontinuous Lagrange")
+
 
 # --------------------------------------------------------------------------------------------------
 def create_dolfin_function(
@@ -46,6 +61,10 @@ def create_dolfin_function(
         Expressions to be compiled in dolfin need to adhere to C++ syntax. Dolfin can compile most
         functions from the [`cmath`](https://en.cppreference.com/w/cpp/header/cmath) library.
 
+    !!! tip "Simple expressions"
+        For Lagrange elements, constants (e.g. `"1.0"`) and coordinates (e.g. `"x[0]"`) are
+        evaluated at the dof coordinates directly, without invoking the dolfin JIT compiler.
+
     Args:
         string_expression (str | Iterable[str]): Expression strings to compile.
         function_space (dl.FunctionSpace): Function space of dolfin function to create.
@@ -66,16 +85,61 @@ def create_dolfin_function(
             f"Number of expression strings ({len(string_expression)})"
             f" must match number of components in function space space ({num_components})."
         )
+    component_expressions = (
+        [string_expression] if isinstance(string_expression, str) else string_expression
+    )
+    simple_expression_values = _evaluate_simple_expressions(component_expressions, function_space)
+    if simple_expression_values is not None:
+        return convert_to_dolfin(simple_expression_values, function_space)
+
     parameter_expression = dl.Expression(string_expression, degree=element_degree)
     parameter_function = dl.Function(function_space)
     parameter_function.interpolate(parameter_expression)
     return parameter_function
 
 
+# --------------------------------------------------------------------------------------------------
+def _evaluate_simple_expressions(
+    string_expressions: Sequence[str],
+    function_space: dl.FunctionSpace,
+) -> npt.NDArray[np.floating] | None:
+    r"""Evaluate constant and coordinate expressions at the dof coordinates of a function space.
+
+    For nodal Lagrange elements, interpolating such expressions is equivalent to evaluating them at
+    the dof coordinates. For $K$ expressions and $N$ dofs per component, the resulting array has
+    shape $K\times N$.
+
+    Args:
+        string_expressions (Sequence[str]): Expression strings, one per component.
+        function_space (dl.FunctionSpace): Function space to evaluate expressions on.
+
+    Returns:
+        npt.NDArray[np.floating] | None: Evaluated expressions, or None if any expression is not
+            simple or the function space does not have a nodal Lagrange element.
+    """
+    if function_space.ufl_element().family() not in _NODAL_ELEMENT_FAMILIES:
+        return None
+    domain_dim = function_space.mesh().geometry().dim()
+    num_dofs = get_component_dofs(function_space).shape[1]
+    expression_values = np.empty((len(string_expressions), num_dofs), dtype=np.float64)
+
+    for i, string in enumerate(string_expressions):
+        coordinate_match = _COORDINATE_EXPRESSION.match(string)
+        if _CONSTANT_EXPRESSION.match(string):
+            expression_values[i] = float(string)
+        elif coordinate_match and int(coordinate_match.group(1)) < domain_dim:
+            coordinates = get_coordinates(function_space)
+            expression_values[i] = coordinates[:, int(coordinate_match.group(1))]
+        else:
+            return None
+    return expression_values
+
+
 # --------------------------------------------------------------------------------------------------
 def convert_to_numpy(
     vector: dl.Vector | dl.PETScVector,
     function_space: dl.FunctionSpace,
+    out: npt.NDArray[np.floating] | None = None,
 ) -> npt.NDArray[np.floating]:
     r"""Convert a dolfin vector to a numpy array.
 
@@ -86,9 +150,13 @@ def convert_to_numpy(
     Args:
         vector (dl.Vector | dl.PETScVector): Vector to convert.
         function_space (dl.FunctionSpace): Function space vector has been defined on.
+        out (npt.NDArray[np.floating] | None, optional): Existing array to write the result to,
+            with the shape given by [`get_array_shape`][spin.fenics.converter.get_array_shape].
+            If not provided, a new array is allocated. Defaults to None.
 
     Raises:
         ValueError: Checks that the size of the vector matches the function space dimension.
+        ValueError: Checks that the shape of the output array matches the function space.
 
     Returns:
         npt.NDArray[np.floating]: Converted numpy array.
@@ -98,24 +166,65 @@ def convert_to_numpy(
             f"Vector size ({vector.size()}) does not match "
             f"function space dimension ({function_space.dim()})."
         )
-    vector = vector.get_local()
-    num_components = function_space.num_sub_spaces()
+    array_shape = get_array_shape(function_space)
+    if out is not None and not out.shape == array_shape:
+        raise ValueError(
+            f"Output array shape {out.shape} does not match expected shape {array_shape}."
+        )
+    numpy_array = np.empty(array_shape, dtype=np.float64) if out is None else out
+    local_array = _get_local_view(vector)
 
-    if num_components <= 1:
-        numpy_array = vector
+    if function_space.num_sub_spaces() <= 1:
+        numpy_array[:] = local_array
     else:
-        components = []
-        for i in range(num_components):
-            component_dofs = function_space.sub(i).dofmap().dofs()
-            components.append(vector[component_dofs])
-        numpy_array = np.stack(components, axis=0)
+        _gather(
+            local_array,
+            get_component_dofs(function_space),
+            numpy_array,
+            _get_dof_layout(function_space),
+        )
     return numpy_array
 
 
+# --------------------------------------------------------------------------------------------------
+def convert_many_to_numpy(
+    vectors: Sequence[dl.Vector | dl.PETScVector],
+    function_space: dl.FunctionSpace,
+    out: Sequence[npt.NDArray[np.floating]] | None = None,
+) -> list[npt.NDArray[np.floating]]:
+    """Convert multiple dolfin vectors on the same function space to numpy arrays.
+
+    Batched version of the [`convert_to_numpy`][spin.fenics.converter.convert_to_numpy] method.
+    If no output arrays are provided, all vectors are gathered into a single, preallocated array,
+    and the returned arrays are views into this array.
+
+    Args:
+        vectors (Sequence[dl.Vector | dl.PETScVector]): Vectors to convert.
+        function_space (dl.FunctionSpace): Function space all vectors have been defined on.
+        out (Sequence[npt.NDArray[np.floating]] | None, optional): Existing arrays to write the
+            results to, one per vector. Defaults to None.
+
+    Raises:
+        ValueError: Checks that the size of individual vectors matches the function space dimension.
+        ValueError: Checks that the number of output arrays matches the number of vectors.
+
+    Returns:
+        list[npt.NDArray[np.floating]]: Converted arrays.
+    """
+    if out is None:
+        out = np.empty((len(vectors), *get_array_shape(function_space)), dtype=np.float64)
+    numpy_arrays = [
+        convert_to_numpy(vector, function_space, out=numpy_array)
+        for vector, numpy_array in zip(vectors, out, strict=True)
+    ]
+    return numpy_arrays
+
+
 # --------------------------------------------------------------------------------------------------
 def convert_to_dolfin(
     array: npt.NDArray[np.floating],
     function_space: dl.FunctionSpace,
+    out: dl.Function | None = None,
 ) -> dl.Function:
     r"""Convert a numpy array to a dolfin function.
 
@@ -128,26 +237,48 @@ def convert_to_dolfin(
     Args:
         array (npt.NDArray[np.floating]): Numpy array to convert.
         function_space (dl.FunctionSpace): Function space to project to.
+        out (dl.Function | None, optional): Existing function on the given function space to
+            overwrite. If not provided, a new function is allocated. Defaults to None.
 
     Raises:
         ValueError: Checks that the size of the array matches the function space dimension.
+        ValueError: Checks that the size of the output function matches the function space
+            dimension.
 
     Returns:
-        dl.Function: Created dolfin function.
+        dl.Function: Created or overwritten dolfin function.
     """
     if not array.size == function_space.dim():
         raise ValueError(
             f"Array size ({array.size}) does not match "
             f"function space dimension ({function_space.dim()})."
         )
-    dolfin_function = dl.Function(function_space)
+    if out is not None and not out.vector().size() == function_space.dim():
+        raise ValueError(
+            f"Output function size ({out.vector().size()}) does not match "
+            f"function space dimension ({function_space.dim()})."
+        )
+    dolfin_function = dl.Function(function_space) if out is None else out
     num_components = function_space.num_sub_spaces()
     if num_components <= 1:
-        dolfin_function.vector().set_local(array.flatten())
+        dolfin_function.vector().set_local(np.ascontiguousarray(array, dtype=np.float64).ravel())
     else:
-        for i in range(num_components):
-            component_dofs = function_space.sub(i).dofmap().dofs()
-            dolfin_function.vector()[component_dofs] = array[i, :]
+        component_dofs = get_component_dofs(function_space)
+        dof_layout = _get_dof_layout(function_space)
+        backend_vector = dl.as_backend_type(dolfin_function.vector())
+        if hasattr(backend_vector, "vec"):
+            # The writable view is restored to PETSc once it goes out of scope
+            _scatter(
+                array, component_dofs, backend_vector.vec().getArray(readonly=False), dof_layout
+            )
+        else:
+            local_array = _scatter(
+                array,
+                component_dofs,
+                np.empty(dolfin_function.vector().local_size(), dtype=np.float64),
+                dof_layout,
+            )
+            dolfin_function.vector().set_local(local_array)
     dolfin_function.vector().apply("insert")
     return dolfin_function
 
@@ -163,7 +294,7 @@ def convert_multivector_to_numpy(
     [`Multivector`](https://hippylib.readthedocs.io/en/latest/hippylib.algorithms.html?highlight=multivector#module-hippylib.algorithms.multivector)
     (a compiled collection of dolfin vectors) to a list of numpy arrays. Each individual vector has
     to be defined from the same function space, and is converted with the
-    [`convert_to_numpy`][spin.fenics.converter.convert_to_numpy] method.
+    [`convert_many_to_numpy`][spin.fenics.converter.convert_many_to_numpy] method.
 
     Args:
         multivector (hl.MultiVector): Multivector to convert.
@@ -181,7 +312,9 @@ def convert_multivector_to_numpy(
             f"function space dimension ({function_space.dim()})."
         )
     num_vectors = multivector.nvec()
-    list_of_arrays = [convert_to_numpy(multivector[i], function_space) for i in range(num_vectors)]
+    list_of_arrays = convert_many_to_numpy(
+        [multivector[i] for i in range(num_vectors)], function_space
+    )
     return list_of_arrays
 
 
@@ -233,7 +366,13 @@ def get_coordinates(
 
     For vector spaces, the same coordinates are assumed for all components, so that only the
     coordinates of the first component are returned. For a mesh with $N$ vertices, in $D$
-    dimensions, the resulting array has shape $N\times D$.
+    dimensions, the resulting array has shape $N\times D$. The ordering of the coordinates matches
+    the ordering of the arrays returned by
+    [`convert_to_numpy`][spin.fenics.converter.convert_to_numpy].
+
+    !!! note "Cached coordinates"
+        Coordinates are only tabulated on the first call for a given function space and cached
+        afterwards. Every call returns an independent copy of the cached array.
 
     Args:
         function_space (dl.FunctionSpace): Function space to extract coordinates from.
@@ -241,14 +380,214 @@ def get_coordinates(
     Returns:
         npt.NDArray[np.floating]: Numpy array of mesh coordinates.
     """
-    num_components = function_space.num_sub_spaces()
-    coordinates = function_space.tabulate_dof_coordinates()
-    if num_components > 1:
-        component_dofs = function_space.sub(0).dofmap().dofs()
-        coordinates = coordinates[component_dofs]
+    cache_key = id(function_space)
+    if cache_key not in _coordinates_cache:
+        num_components = function_space.num_sub_spaces()
+        coordinates = function_space.tabulate_dof_coordinates()
+        if num_components > 1:
+            component_dofs = function_space.sub(0).dofmap().dofs()
+            coordinates = coordinates[component_dofs]
+        _add_to_cache(_coordinates_cache, function_space, coordinates)
+    coordinates = _coordinates_cache[cache_key].copy()
     return coordinates
 
 
+# --------------------------------------------------------------------------------------------------
+def get_component_dofs(function_space: dl.FunctionSpace) -> npt.NDArray[np.integer]:
+    r"""Get the cached dof index table of a (vector) function space.
+
+    For a function space with $K$ components and $N$ dofs per component, the returned table has
+    shape $K\times N$, where row $i$ holds the dofs of the $i$-th subspace. Scalar function spaces
+    yield a table of shape $1\times N$. Querying the dofmaps from dolfin is comparatively expensive,
+    so the table is only assembled on the first call for a given function space and cached
+    afterwards.
+
+    Args:
+        function_space (dl.FunctionSpace): Function space to get dof indices for.
+
+    Raises:
+        ValueError: Checks that all components of the function space have the same number of dofs.
+
+    Returns:
+        npt.NDArray[np.integer]: Dof index table of the function space.
+    """
+    cache_key = id(function_space)
+    if cache_key not in _dof_indices_cache:
+        num_components = function_space.num_sub_spaces()
+        if num_components == 0:
+            dofmaps = [function_space.dofmap()]
+        else:
+            dofmaps = [function_space.sub(i).dofmap() for i in range(num_components)]
+        dofs_per_component = [dofmap.dofs() for dofmap in dofmaps]
+        num_dofs_per_component = [dofs.size for dofs in dofs_per_component]
+        if len(set(num_dofs_per_component)) > 1:
+            raise ValueError(
+                f"Components of the function space have different numbers of dofs "
+                f"({num_dofs_per_component}), which is not supported."
+            )
+        component_dofs = np.stack(dofs_per_component, axis=0).astype(np.intp)
+        dof_layout = _detect_dof_layout(component_dofs)
+        _add_to_cache(_dof_indices_cache, function_space, (component_dofs, dof_layout))
+    component_dofs, _ = _dof_indices_cache[cache_key]
+    return component_dofs
+
+
+# --------------------------------------------------------------------------------------------------
+def _add_to_cache(cache: dict, function_space: dl.FunctionSpace, value: object) -> None:
+    """Add a value to a cache keyed by function space id.
+
+    The cache does not keep the function space alive. Instead, the entry is removed as soon as the
+    function space is garbage collected, before its id can be reused by another object.
+
+    Args:
+        cache (dict): Cache to add value to.
+        function_space (dl.FunctionSpace): Function space the value belongs to.
+        value (object): Value to cache.
+    """
+    cache_key = id(function_space)
+    cache[cache_key] = value
+    weakref.finalize(function_space, cache.pop, cache_key, None)
+
+
+# --------------------------------------------------------------------------------------------------
+def get_array_shape(function_space: dl.FunctionSpace) -> tuple[int, ...]:
+    r"""Get the shape of numpy arrays representing vectors on a function space.
+
+    For $K>1$ components with $N$ dofs each, arrays have shape $K\times N$. Arrays on scalar
+    function spaces are one-dimensional.
+
+    Args:
+        function_space (dl.FunctionSpace): Function space to get array shape for.
+
+    Returns:
+        tuple[int, ...]: Array shape.
+    """
+    if function_space.num_sub_spaces() <= 1:
+        return (function_space.dim(),)
+    return get_component_dofs(function_space).shape
+
+
+# --------------------------------------------------------------------------------------------------
+def _get_dof_layout(function_space: dl.FunctionSpace) -> str:
+    """Get the cached dof layout of a (vector) function space.
+
+    Args:
+        function_space (dl.FunctionSpace): Function space to get dof layout for.
+
+    Returns:
+        str: Dof layout, see `_detect_dof_layout`.
+    """
+    get_component_dofs(function_space)
+    _, dof_layout = _dof_indices_cache[id(function_space)]
+    return dof_layout
+
+
+# --------------------------------------------------------------------------------------------------
+def _detect_dof_layout(component_dofs: npt.NDArray[np.integer]) -> str:
+    r"""Detect if a dof index table has a regular layout.
+
+    For $K$ components with $N$ dofs each, the layout is `"blocked"` if the dofs of all components
+    are interleaved, i.e. dof $j$ of component $i$ has index $jK+i$, and `"contiguous"` if every
+    component occupies a contiguous range, i.e. the index is $iN+j$. Both layouts can be converted
+    by reshaping instead of index-based gathering. All other tables have the `"general"` layout.
+
+    Args:
+        component_dofs (npt.NDArray[np.integer]): Dof index table of a function space.
+
+    Returns:
+        str: Dof layout, one of `"blocked"`, `"contiguous"`, or `"general"`.
+    """
+    num_components, num_dofs = component_dofs.shape
+    dof_range = np.arange(component_dofs.size)
+    if np.array_equal(component_dofs, dof_range.reshape(num_dofs, num_components).T):
+        dof_layout = "blocked"
+    elif np.array_equal(component_dofs, dof_range.reshape(num_components, num_dofs)):
+        dof_layout = "contiguous"
+    else:
+        dof_layout = "general"
+    return dof_layout
+
+
+# --------------------------------------------------------------------------------------------------
+def _get_local_view(vector: dl.Vector | dl.PETScVector) -> npt.NDArray[np.floating]:
+    """Get a read-only view of the process-local entries of a dolfin vector.
+
+    For PETSc-backed vectors, the local PETSc buffer is accessed directly, avoiding the copy made by
+    `get_local`. All other vectors fall back to `get_local`.
+
+    Args:
+        vector (dl.Vector | dl.PETScVector): Vector to access.
+
+    Returns:
+        npt.NDArray[np.floating]: Local entries of the vector.
+    """
+    backend_vector = dl.as_backend_type(vector)
+    if hasattr(backend_vector, "vec"):
+        return backend_vector.vec().getArray(readonly=True)
+    return vector.get_local()
+
+
+# --------------------------------------------------------------------------------------------------
+def _gather(
+    local_array: npt.NDArray[np.floating],
+    component_dofs: npt.NDArray[np.integer],
+    out: npt.NDArray[np.floating],
+    dof_layout: str = "general",
+) -> npt.NDArray[np.floating]:
+    """Gather the components of a local vector array into a preallocated array.
+
+    Args:
+        local_array (npt.NDArray[np.floating]): Local entries of a vector on a vector space.
+        component_dofs (npt.NDArray[np.integer]): Dof index table of the function space.
+        out (npt.NDArray[np.floating]): Output array, with the same shape as the index table.
+        dof_layout (str, optional): Layout of the index table, regular layouts are copied without
+            indexing. Defaults to "general".
+
+    Returns:
+        npt.NDArray[np.floating]: Component-wise array, written to `out`.
+    """
+    num_components, num_dofs = component_dofs.shape
+    if dof_layout == "blocked":
+        out[:] = local_array.reshape(num_dofs, num_components).T
+    elif dof_layout == "contiguous":
+        out[:] = local_array.reshape(num_components, num_dofs)
+    else:
+        np.take(local_array, component_dofs, out=out)
+    return out
+
+
+# --------------------------------------------------------------------------------------------------
+def _scatter(
+    component_array: npt.NDArray[np.floating],
+    component_dofs: npt.NDArray[np.integer],
+    out: npt.NDArray[np.floating],
+    dof_layout: str = "general",
+) -> npt.NDArray[np.floating]:
+    """Scatter a component-wise array into a preallocated local vector array.
+
+    Counterpart of the `_gather` method.
+
+    Args:
+        component_array (npt.NDArray[np.floating]): Component-wise array, with the same shape as
+            the index table.
+        component_dofs (npt.NDArray[np.integer]): Dof index table of the function space.
+        out (npt.NDArray[np.floating]): Local vector array to write to.
+        dof_layout (str, optional): Layout of the index table, regular layouts are copied without
+            indexing. Defaults to "general".
+
+    Returns:
+        npt.NDArray[np.floating]: Local vector array, written to `out`.
+    """
+    num_components, num_dofs = component_dofs.shape
+    if dof_layout == "blocked":
+        out.reshape(num_dofs, num_components)[:] = component_array.T
+    elif dof_layout == "contiguous":
+        out.reshape(num_components, num_dofs)[:] = component_array
+    else:
+        out[component_dofs] = component_array
+    return out
+
+
 # --------------------------------------------------------------------------------------------------
 def extract_components(
     vector: dl.Vector | dl.PETScVector,
@@ -263,7 +602,7 @@ def extract_components(
 
     !!! note "In-place operation"
         This method modifies the components in-place, which have to be provided as input argument.
-        No new memory is allocated.
+        No new vectors are allocated.
 
     Args:
         vector (dl.Vector | dl.PETScVector): Vector to split up.
@@ -288,10 +627,12 @@ def extract_components(
             f"function space dimension ({function_space.dim()})."
         )
 
-    for i, component in enumerate(components):
-        subspace = function_space.sub(i)
-        component_dofs = subspace.dofmap().dofs()
-        component.set_local(vector[component_dofs])
+    local_array = _get_local_view(vector)
+    component_dofs = get_component_dofs(function_space)
+    component_buffer = np.empty(component_dofs.shape[1], dtype=np.float64)
+    for component, dofs in zip(components, component_dofs, strict=True):
+        np.take(local_array, dofs, out=component_buffer)
+        component.set_local(component_buffer)
         component.apply("insert")
     return components
 
@@ -306,7 +647,7 @@ def combine_components(
 
     !!! note "In-place operation"
         This method modifies the vector in-place, which has to be provided as input argument.
-        No new memory is allocated.
+        No new vectors are allocated.
 
     Args:
         components (Iterable[dl.Vector, dl.PETScVector]): Components to assemble into vector.
@@ -331,9 +672,11 @@ def combine_components(
             f"function space dimension ({function_space.dim()})."
         )
 
-    for i, component in enumerate(components):
-        component_dofs = function_space.sub(i).dofmap().dofs()
-        vector[component_dofs] = component.get_local()
+    local_array = np.empty(vector.local_size(), dtype=np.float64)
+    component_dofs = get_component_dofs(function_space)
+    for component, dofs in zip(components, component_dofs, strict=True):
+        local_array[dofs] = _get_local_view(component)
+    vector.set_local(local_array)
     vector.apply("insert")
     return vector
 
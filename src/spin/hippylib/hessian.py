@@ -4,7 +4,8 @@ This module provides a wrapper for the corresponding functionality in Hippylib.
 done via dataclasses, all input and output vectors are numpy arrays.
 
 Internally, the module uses the double-pass algorithm in Hippylib, to compute a randomized truncated
-SVD of the Hessian operator of the provided Hippylib inference model.
+SVD of the Hessian operator of the provided Hippylib inference model. In addition, the Hessian can
+be exposed as a matrix-free Scipy linear operator, which only relies on Hessian-vector products.
 
 Classes:
     LowRankHessianSettings: Configuration for the low-rank computation
@@ -12,15 +13,20 @@ Classes:
 Functions:
     compute_low_rank_hessian: Compute the low-rank Hessian approximation of the inference model
         posterior at a given evaluation point.
+    create_hessian_operator: Create a matrix-free linear operator for the Hessian of the inference
+        model posterior at a given evaluation point.
 """
 
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Annotated
 
+import dolfin as dl
 import hippylib as hl
 import numpy as np
 import numpy.typing as npt
+import scipy as sp
+import scipy.sparse.linalg
 from beartype.vale import Is
 
 from spin.fenics import converter as fex_converter
@@ -126,3 +132,72 @@ def compute_low_rank_hessian(
     )
     eigenvectors = fex_converter.convert_multivector_to_numpy(eigenvectors, function_spaces[1])
     return eigenvalues, eigenvectors
+
+
+# --------------------------------------------------------------------------------------------------
+def create_hessian_operator(
+    inference_model: hl.Model,
+    evaluation_point: Iterable[
+        npt.NDArray[np.floating], npt.NDArray[np.floating], npt.NDArray[np.floating]
+    ],
+    gauss_newton_approximation: bool = False,
+    misfit_only: bool = False,
+) -> sp.sparse.linalg.LinearOperator:
+    r"""Create a matrix-free linear operator for the Hessian of the inference model posterior.
+
+    The Hessian is never assembled, the operator only evaluates Hessian-vector products through the
+    Hippylib
+    [`ReducedHessian`](https://hippylib.readthedocs.io/en/latest/hippylib.modeling.html#module-hippylib.modeling.reducedHessian),
+    each of which requires one incremental forward and one incremental adjoint solve. The resulting
+    operator can be used with Scipy's iterative solvers, e.g. `scipy.sparse.linalg.cg`. For a
+    parameter space with $K$ components and $N$ dofs per component, the operator acts on flattened
+    arrays of size $KN$, where the $K\times N$ layout is the one used throughout SPIN.
+
+    !!! warning "Hessian evaluation point"
+        The evaluation point is stored in the inference model, not in the operator. Any later call
+        that sets a new point for Hessian evaluations on the same model, e.g. a Newton-CG solve or
+        [`compute_low_rank_hessian`][spin.hippylib.hessian.compute_low_rank_hessian], silently
+        changes the Hessian the operator applies.
+
+    Args:
+        inference_model (hl.Model): Hippylib inference model to use for computations.
+        evaluation_point (tuple[npt.NDArray, npt.NDArray, npt.NDArray]):
+            The evaluation point for the Hessian.
+        gauss_newton_approximation (bool, optional): Whether to use the Gauss-Newton
+            approximation. Defaults to False.
+        misfit_only (bool, optional): Whether to only consider the misfit part of the Hessian.
+            Defaults to False.
+
+    Returns:
+        sp.sparse.linalg.LinearOperator: Matrix-free Hessian operator.
+    """
+    function_spaces = inference_model.problem.Vh
+    evaluation_point_vectors = []
+    for array, function_space in zip(evaluation_point, function_spaces, strict=True):
+        evaluation_point_vectors.append(
+            fex_converter.convert_to_dolfin(array, function_space).vector()
+        )
+    inference_model.setPointForHessianEvaluations(
+        evaluation_point_vectors, gauss_newton_approximation
+    )
+    reduced_hessian = hl.ReducedHessian(inference_model, misfit_only=misfit_only)
+    parameter_space = function_spaces[hl.PARAMETER]
+    direction_function = dl.Function(parameter_space)
+    output_vector = inference_model.generate_vector(hl.PARAMETER)
+
+    parameter_dim = parameter_space.dim()
+    array_shape = fex_converter.get_array_shape(parameter_space)
+
+    def hessian_vector_product(direction: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
+        direction_vector = fex_converter.convert_to_dolfin(
+            direction.reshape(array_shape), parameter_space, out=direction_function
+        ).vector()
+        reduced_hessian.mult(direction_vector, output_vector)
+        return fex_converter.convert_to_numpy(output_vector, parameter_space).ravel()
+
+    hessian_operator = sp.sparse.linalg.LinearOperator(
+        shape=(parameter_dim, parameter_dim),
+        matvec=hessian_vector_product,
+        dtype=np.float64,
+    )
+    return hessian_operator
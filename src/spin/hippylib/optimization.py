@@ -17,12 +17,19 @@ Classes:
     SolverSettings: Configuration of the Newton-CG solver.
     SolverResult: Data class for storage of solver results
     NewtonCGSolver: Wrapper class for the inexact Newton-CG solver implementation in Hippylib.
+
+Functions:
+    solve_batch: Solve the optimization problem for multiple initial guesses in parallel.
 """
 
+import multiprocessing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from numbers import Real
 from typing import Annotated
 
+import dolfin as dl
 import hippylib as hl
 import numpy as np
 import numpy.typing as npt
@@ -30,6 +37,15 @@ from beartype.vale import Is
 
 from spin.fenics import converter as fex_converter
 
+# Validated types shared between fields, to avoid repeating the same validators for readability
+_UnitIntervalReal = Annotated[Real, Is[lambda x: 0 < x < 1]]
+_NonNegativeReal = Annotated[Real, Is[lambda x: x >= 0]]
+_PositiveInt = Annotated[int, Is[lambda x: x > 0]]
+_NonNegativeInt = Annotated[int, Is[lambda x: x >= 0]]
+
+# Solver instance of a worker process in batch solves, see `solve_batch`
+_worker_solver = None
+
 
 # ==================================================================================================
 @dataclass
@@ -51,18 +67,22 @@ class SolverSettings:
         max_num_cg_iterations (int): Maximum number of conjugate gradient iterations.
         armijo_line_search_constant (Real): Constant for the Armijo line search.
         max_num_line_search_iterations (int): Maximum number of line search iterations.
+        warm_start_tolerance (Real | None): If given, the gradient norm is evaluated for the initial
+            guess first. If it is below the tolerance, the initial guess is returned without
+            running Newton iterations. Useful for warm-started solves.
         verbose (bool): Whether to print the solver output.
     """
 
-    relative_tolerance: Annotated[Real, Is[lambda x: 0 < x < 1]] = 1e-6
-    absolute_tolerance: Annotated[Real, Is[lambda x: 0 < x < 1]] = 1e-12
-    gradient_projection_tolerance: Annotated[Real, Is[lambda x: 0 < x < 1]] = 1e-18
-    max_num_newton_iterations: Annotated[int, Is[lambda x: x > 0]] = 20
-    num_gauss_newton_iterations: Annotated[int, Is[lambda x: x > 0]] = 5
-    coarsest_tolerance_cg: Annotated[Real, Is[lambda x: 0 < x < 1]] = 5e-1
-    max_num_cg_iterations: Annotated[int, Is[lambda x: x > 0]] = 100
-    armijo_line_search_constant: Annotated[Real, Is[lambda x: 0 < x < 1]] = 1e-4
-    max_num_line_search_iterations: Annotated[int, Is[lambda x: x > 0]] = 10
+    relative_tolerance: _UnitIntervalReal = 1e-6
+    absolute_tolerance: _UnitIntervalReal = 1e-12
+    gradient_projection_tolerance: _UnitIntervalReal = 1e-18
+    max_num_newton_iterations: _PositiveInt = 20
+    num_gauss_newton_iterations: _PositiveInt = 5
+    coarsest_tolerance_cg: _UnitIntervalReal = 5e-1
+    max_num_cg_iterations: _PositiveInt = 100
+    armijo_line_search_constant: _UnitIntervalReal = 1e-4
+    max_num_line_search_iterations: _PositiveInt = 10
+    warm_start_tolerance: _UnitIntervalReal | None = None
     verbose: bool = True
 
 
@@ -86,9 +106,9 @@ class SolverResult:
     forward_solution: npt.NDArray[np.floating]
     adjoint_solution: npt.NDArray[np.floating]
     converged: bool
-    num_iterations: Annotated[int, Is[lambda x: x >= 0]]
+    num_iterations: _NonNegativeInt
     termination_reason: str
-    final_gradient_norm: Annotated[Real, Is[lambda x: x >= 0]]
+    final_gradient_norm: _NonNegativeReal
 
 
 # ==================================================================================================
@@ -111,7 +131,8 @@ class NewtonCGSolver:
     documentation.
 
     Methods:
-        run: Start the solver with an initial guess.
+        solve: Start the solver with an initial guess.
+        allocate_result: Allocate a result object that can be reused across solver runs.
     """
 
     # ----------------------------------------------------------------------------------------------
@@ -140,16 +161,34 @@ class NewtonCGSolver:
         )
         self._hl_newtoncgsolver = hl.ReducedSpaceNewtonCG(inference_model, hippylib_parameterlist)
         self._inference_model = inference_model
+        # Pre-compute dof index tables, so that conversions are already cached for the first solve
+        for function_space in (
+            self._inference_model.problem.Vh[hl.STATE],
+            self._inference_model.problem.Vh[hl.PARAMETER],
+        ):
+            fex_converter.get_component_dofs(function_space)
+        # Buffers reused by Hippylib's solver in every run
+        self._parameter_buffer = dl.Function(self._inference_model.problem.Vh[hl.PARAMETER])
+        self._forward_buffer = self._inference_model.generate_vector(hl.STATE)
+        self._adjoint_buffer = self._inference_model.generate_vector(hl.ADJOINT)
+        self._gradient_buffer = self._inference_model.generate_vector(hl.PARAMETER)
+        self._warm_start_tolerance = solver_settings.warm_start_tolerance
 
     # ----------------------------------------------------------------------------------------------
-    def solve(self, initial_guess: npt.NDArray[np.floating]) -> SolverResult:
+    def solve(
+        self, initial_guess: npt.NDArray[np.floating], out: SolverResult | None = None
+    ) -> SolverResult:
         """Run the solver, given an initial guess.
 
         Args:
             initial_guess (npt.NDArray[np.floating]): Initial guess for the optimization problem.
+            out (SolverResult | None, optional): Existing result object to overwrite, e.g. from
+                [`allocate_result`][spin.hippylib.optimization.NewtonCGSolver.allocate_result].
+                If not provided, a new result object is allocated. Defaults to None.
 
         Raises:
             ValueError: Checks if the initial guess has the correct size.
+            ValueError: Checks if the arrays of the output result object have the correct shapes.
 
         Returns:
             SolverResult: Optimal solution and metadata.
@@ -161,32 +200,186 @@ class NewtonCGSolver:
                 f"Initial guess has wrong size {initial_guess.size}, "
                 f"expected {function_space_parameter.dim()}."
             )
+        if out is not None:
+            parameter_shape = fex_converter.get_array_shape(function_space_parameter)
+            variables_shape = fex_converter.get_array_shape(function_space_variables)
+            for name, array, expected_shape in (
+                ("optimal_parameter", out.optimal_parameter, parameter_shape),
+                ("forward_solution", out.forward_solution, variables_shape),
+                ("adjoint_solution", out.adjoint_solution, variables_shape),
+            ):
+                if not array.shape == expected_shape:
+                    raise ValueError(
+                        f"Output array {name} has wrong shape {array.shape}, "
+                        f"expected {expected_shape}."
+                    )
 
         initial_function = fex_converter.convert_to_dolfin(
-            initial_guess.copy(), function_space_parameter
+            initial_guess, function_space_parameter, out=self._parameter_buffer
         )
         initial_vector = initial_function.vector()
-        forward_solution, optimal_parameter, adjoint_solution = self._hl_newtoncgsolver.solve(
-            [None, initial_vector, None]
+        # Reset buffers, as nonlinear forward solves use the state vector as starting point
+        self._forward_buffer.zero()
+        self._adjoint_buffer.zero()
+        solution_vectors = [self._forward_buffer, initial_vector, self._adjoint_buffer]
+        if self._warm_start_tolerance is not None:
+            initial_gradient_norm = self._evaluate_gradient_norm(solution_vectors)
+            warm_start_converged = initial_gradient_norm < self._warm_start_tolerance
+        else:
+            warm_start_converged = False
+
+        if warm_start_converged:
+            converged = True
+            num_iterations = 0
+            termination_reason = "Norm of the initial gradient less than warm start tolerance"
+            final_gradient_norm = initial_gradient_norm
+        else:
+            solution_vectors = self._hl_newtoncgsolver.solve(solution_vectors)
+            converged = self._hl_newtoncgsolver.converged
+            num_iterations = self._hl_newtoncgsolver.it
+            termination_reason = self._hl_newtoncgsolver.termination_reasons[
+                self._hl_newtoncgsolver.reason
+            ]
+            final_gradient_norm = self._hl_newtoncgsolver.final_grad_norm
+
+        forward_solution, optimal_parameter, adjoint_solution = solution_vectors
+        solver_result = self.allocate_result() if out is None else out
+        fex_converter.convert_to_numpy(
+            optimal_parameter, function_space_parameter, out=solver_result.optimal_parameter
         )
-        optimal_parameter = fex_converter.convert_to_numpy(
-            optimal_parameter, function_space_parameter
+        fex_converter.convert_many_to_numpy(
+            [forward_solution, adjoint_solution],
+            function_space_variables,
+            out=[solver_result.forward_solution, solver_result.adjoint_solution],
         )
-        forward_solution = fex_converter.convert_to_numpy(
-            forward_solution, function_space_variables
+        solver_result.converged = converged
+        solver_result.num_iterations = num_iterations
+        solver_result.termination_reason = termination_reason
+        solver_result.final_gradient_norm = final_gradient_norm
+        return solver_result
+
+    # ----------------------------------------------------------------------------------------------
+    def _evaluate_gradient_norm(
+        self,
+        solution_vectors: list[dl.Vector | dl.PETScVector],
+    ) -> Real:
+        """Evaluate the gradient norm of the cost functional for a given parameter.
+
+        The forward and adjoint problems are solved for the parameter, and the solutions are
+        written to the respective vectors. The gradient norm is the one used by Hippylib's
+        Newton-CG solver for its termination criteria.
+
+        Args:
+            solution_vectors (list[dl.Vector | dl.PETScVector]): Forward, parameter and adjoint
+                vectors. Only the parameter vector is read.
+
+        Returns:
+            Real: Gradient norm.
+        """
+        forward_vector, _, adjoint_vector = solution_vectors
+        self._inference_model.solveFwd(forward_vector, solution_vectors)
+        self._inference_model.solveAdj(adjoint_vector, solution_vectors)
+        gradient_norm = self._inference_model.evalGradientParameter(
+            solution_vectors, self._gradient_buffer
         )
-        adjoint_solution = fex_converter.convert_to_numpy(
-            adjoint_solution, function_space_variables
+        return gradient_norm
+
+    # ----------------------------------------------------------------------------------------------
+    def allocate_result(self) -> SolverResult:
+        """Allocate a result object that can be reused across solver runs.
+
+        The arrays of the result object have the correct shapes for the inference model, but are
+        not initialized. Passing the object to the
+        [`solve`][spin.hippylib.optimization.NewtonCGSolver.solve] method overwrites its content
+        in-place, avoiding new allocations for repeated solves.
+
+        Returns:
+            SolverResult: Uninitialized result object.
+        """
+        function_space_variables = self._inference_model.problem.Vh[hl.STATE]
+        function_space_parameter = self._inference_model.problem.Vh[hl.PARAMETER]
+        optimal_parameter = np.empty(
+            fex_converter.get_array_shape(function_space_parameter), dtype=np.float64
+        )
+        forward_solution, adjoint_solution = np.empty(
+            (2, *fex_converter.get_array_shape(function_space_variables)), dtype=np.float64
         )
         solver_result = SolverResult(
             optimal_parameter=optimal_parameter,
             forward_solution=forward_solution,
             adjoint_solution=adjoint_solution,
-            converged=self._hl_newtoncgsolver.converged,
-            num_iterations=self._hl_newtoncgsolver.it,
-            termination_reason=self._hl_newtoncgsolver.termination_reasons[
-                self._hl_newtoncgsolver.reason
-            ],
-            final_gradient_norm=self._hl_newtoncgsolver.final_grad_norm,
+            converged=False,
+            num_iterations=0,
+            termination_reason="",
+            final_gradient_norm=0.0,
         )
         return solver_result
+
+
+# --------------------------------------------------------------------------------------------------
+def solve_batch(
+    solver_settings: SolverSettings,
+    inference_model_factory: Callable[[], hl.Model],
+    initial_guesses: Iterable[npt.NDArray[np.floating]],
+    num_workers: _PositiveInt,
+) -> list[SolverResult]:
+    """Solve the optimization problem for multiple initial guesses in parallel.
+
+    This is useful for multi-start optimization, where the individual solves are independent.
+    Dolfin and PETSc objects can neither be shared between threads safely, nor be copied or sent to
+    other processes. Therefore, every worker process builds its own inference model once, by calling
+    the provided factory, and initializes a
+    [`NewtonCGSolver`][spin.hippylib.optimization.NewtonCGSolver] for it. The initial guesses are
+    then distributed among the workers.
+
+    !!! warning "Worker processes"
+        Every worker holds a complete copy of the inference model. Workers are started with the
+        `spawn` method, so the factory has to be importable by its module path. Factories defined
+        in a notebook or in the `__main__` module of a script cannot be loaded by the workers.
+        Scripts calling this function also need an `if __name__ == "__main__":` guard.
+
+    Args:
+        solver_settings (SolverSettings): Solver configuration.
+        inference_model_factory (Callable[[], hl.Model]): Function that creates the inference
+            model. It needs to be defined at the top level of an importable module.
+        initial_guesses (Iterable[npt.NDArray[np.floating]]): Initial guesses to solve for.
+        num_workers (int): Number of worker processes.
+
+    Returns:
+        list[SolverResult]: Optimal solutions and metadata, in the order of the initial guesses.
+    """
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker_solver,
+        initargs=(solver_settings, inference_model_factory),
+    ) as executor:
+        solver_results = list(executor.map(_solve_in_worker, initial_guesses))
+    return solver_results
+
+
+# --------------------------------------------------------------------------------------------------
+def _initialize_worker_solver(
+    solver_settings: SolverSettings, inference_model_factory: Callable[[], hl.Model]
+) -> None:
+    """Initialize the solver of a worker process in batch solves.
+
+    Args:
+        solver_settings (SolverSettings): Solver configuration.
+        inference_model_factory (Callable[[], hl.Model]): Function that creates the inference model.
+    """
+    global _worker_solver  # noqa: PLW0603
+    _worker_solver = NewtonCGSolver(solver_settings, inference_model_factory())
+
+
+# --------------------------------------------------------------------------------------------------
+def _solve_in_worker(initial_guess: npt.NDArray[np.floating]) -> SolverResult:
+    """Run the solver of a worker process in batch solves.
+
+    Args:
+        initial_guess (npt.NDArray[np.floating]): Initial guess for the optimization problem.
+
+    Returns:
+        SolverResult: Optimal solution and metadata.
+    """
+    return _worker_solver.solve(initial_guess)